@@ -16,8 +16,6 @@ from shutil import which
 from textwrap import dedent
 from typing import Any, Iterator, Mapping, MutableMapping, NamedTuple, Sequence, cast
 
-import tomli
-
 from nbqa import replace_source, save_code_source, save_markdown_source
 from nbqa.cmdline import CLIArgs
 from nbqa.config.config import Configs, get_default_config
@@ -34,6 +32,11 @@ from nbqa.path_utils import (
 from nbqa.save_code_source import CODE_SEPARATOR
 from nbqa.text import BOLD, RESET
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # pragma: nocover
+    import tomli as tomllib  # type: ignore[no-redef]
+
 
 def parse_version(version: str) -> tuple[int, ...]:
     """
@@ -447,7 +450,8 @@ def _get_configs(cli_args: CLIArgs, project_root: Path) -> Configs:
     # If a section is in pyproject.toml, use that.
     pyproject_path = project_root / "pyproject.toml"
     if pyproject_path.is_file():
-        config_file = tomli.loads(pyproject_path.read_text("utf-8"))
+        with pyproject_path.open("rb") as fd:
+            config_file = tomllib.load(fd)
         if "tool" in config_file and "nbqa" in config_file["tool"]:
             file_config = config_file["tool"]["nbqa"]
             for section in config:
@@ -4,58 +4,49 @@ import shutil
 import sys
 from pathlib import Path
 from shutil import copytree  # pylint: disable=E0611,W4901
-from typing import TYPE_CHECKING, Iterator
+from typing import Iterator
 
 import pytest
 
-if TYPE_CHECKING:
-    from py._path.local import LocalPath
-
 
 @pytest.fixture(autouse=True)
-def tmp_pyprojecttoml(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_pyprojecttoml() -> Iterator[Path]:
     """
     Temporarily delete pyproject.toml so it can be recreated during tests.
 
-    Parameters
-    ----------
-    tmpdir
-        Pytest fixture, gives us a temporary directory.
+    The original is kept in memory rather than in the test's ``tmp_path``,
+    so that tests can use ``tmp_path`` as a project root of their own.
+
+    Yields
+    ------
+    Path
+        Path of pyproject.toml in root dir.
     """
     filename = Path("pyproject.toml")
-    temp_file = Path(tmpdir) / filename
-    shutil.copy(str(filename), str(temp_file))
+    content = filename.read_bytes()
     filename.unlink()
     yield filename
-    shutil.copy(str(temp_file), str(filename))
+    filename.write_bytes(content)
 
 
 @pytest.fixture(autouse=True)
-def tmp_setupcfg(tmpdir: "LocalPath") -> Iterator[None]:
-    """
-    Temporarily delete setup.cfg so it can be recreated during tests.
-
-    Parameters
-    ----------
-    tmpdir
-        Pytest fixture, gives us a temporary directory.
-    """
+def tmp_setupcfg() -> Iterator[None]:
+    """Temporarily delete setup.cfg so it can be recreated during tests."""
     filename = Path("setup.cfg")
-    temp_file = Path(tmpdir) / filename
-    shutil.copy(str(filename), str(temp_file))
+    content = filename.read_bytes()
     filename.unlink()
     yield
-    shutil.copy(str(temp_file), str(filename))
+    filename.write_bytes(content)
 
 
 @pytest.fixture
-def tmp_notebook_for_testing(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_notebook_for_testing(tmp_path: Path) -> Iterator[Path]:
     """
     Make temporary copy of test notebook before it's operated on, then revert it.
 
     Parameters
     ----------
-    tmpdir
+    tmp_path
         Pytest fixture, gives us a temporary directory.
 
     Yields
@@ -64,20 +55,20 @@ def tmp_notebook_for_testing(tmpdir: "LocalPath") -> Iterator[Path]:
         Temporary copy of test notebook.
     """
     filename = Path("tests/data") / "notebook_for_testing.ipynb"
-    temp_file = Path(tmpdir) / "tmp.ipynb"
+    temp_file = tmp_path / "tmp.ipynb"
     shutil.copy(str(filename), str(temp_file))
     yield filename
     shutil.copy(str(temp_file), str(filename))
 
 
 @pytest.fixture
-def tmp_notebook_with_multiline(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_notebook_with_multiline(tmp_path: Path) -> Iterator[Path]:
     """
     Make temporary copy of test notebook before it's operated on, then revert it.
 
     Parameters
     ----------
-    tmpdir
+    tmp_path
         Pytest fixture, gives us a temporary directory.
 
     Yields
@@ -86,20 +77,20 @@ def tmp_notebook_with_multiline(tmpdir: "LocalPath") -> Iterator[Path]:
         Temporary copy of test notebook.
     """
     filename = Path("tests/data") / "clean_notebook_with_multiline.ipynb"
-    temp_file = Path(tmpdir) / "tmp.ipynb"
+    temp_file = tmp_path / "tmp.ipynb"
     shutil.copy(str(filename), str(temp_file))
     yield filename
     shutil.copy(str(temp_file), str(filename))
 
 
 @pytest.fixture
-def tmp_notebook_starting_with_md(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_notebook_starting_with_md(tmp_path: Path) -> Iterator[Path]:
     """
     Make temporary copy of test notebook before it's operated on, then revert it.
 
     Parameters
     ----------
-    tmpdir
+    tmp_path
         Pytest fixture, gives us a temporary directory.
 
     Yields
@@ -108,42 +99,127 @@ def tmp_notebook_starting_with_md(tmpdir: "LocalPath") -> Iterator[Path]:
         Temporary copy of notebook.
     """
     filename = Path("tests/data") / "notebook_starting_with_md.ipynb"
-    temp_file = Path(tmpdir) / "tmp.ipynb"
+    temp_file = tmp_path / "tmp.ipynb"
     shutil.copy(str(filename), str(temp_file))
     yield filename
     shutil.copy(str(temp_file), str(filename))
 
 
+@pytest.fixture(scope="session")
+def shared_tmp_test_data(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Make copy of test data, once per session.
+
+    The copy is made the first time a test requests it. Tests which modify
+    ``tests/data`` revert it afterwards, so it matches the checked-in data.
+
+    Parameters
+    ----------
+    tmp_path_factory
+        Pytest fixture, gives us a session-scoped temporary directory.
+
+    Returns
+    -------
+    Path
+        Copy of test data.
+    """
+    snapshot = tmp_path_factory.mktemp("test_data")
+    copytree(str(Path("tests/data")), str(snapshot), dirs_exist_ok=True)
+    return snapshot
+
+
 @pytest.fixture
-def tmp_test_data(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_test_data(  # pylint: disable=W0621
+    shared_tmp_test_data: Path,
+) -> Iterator[Path]:
     """
-    Make temporary copy of test data before it's operated on, then revert it.
+    Let test operate on test data, then revert it.
 
     Parameters
     ----------
-    tmpdir
-        Pytest fixture, gives us a temporary directory.
+    shared_tmp_test_data
+        Pristine copy of test data, used to revert it.
 
     Yields
     ------
     Path
-        Temporary copy of test data.
+        Test data directory.
     """
     dirname = Path("tests/data")
-    temp_dir = Path(tmpdir)
-    copytree(str(dirname), str(temp_dir / dirname))
     yield dirname
-    copytree(str(temp_dir / dirname), str(dirname), dirs_exist_ok=True)
+    copytree(str(shared_tmp_test_data), str(dirname), dirs_exist_ok=True)
 
 
 @pytest.fixture
-def tmp_notebook_with_trailing_semicolon(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_test_data_with_toml(  # pylint: disable=W0621
+    tmp_test_data: Path,
+) -> Iterator[Path]:
+    """
+    Add jupytext config file to test data, removing it afterwards.
+
+    Parameters
+    ----------
+    tmp_test_data
+        Temporary copy of test data.
+
+    Yields
+    ------
+    Path
+        Temporary copy of test data, with ``.jupytext.toml`` in it.
+    """
+    config_file = tmp_test_data / ".jupytext.toml"
+    config_file.write_text(
+        'notebook_metadata_filter = "substitutions"\n', encoding="utf-8"
+    )
+    yield tmp_test_data
+    config_file.unlink()
+
+
+@pytest.fixture(scope="session")
+def notebook_for_testing_bytes() -> bytes:
+    """
+    Read test notebook, once per session.
+
+    Returns
+    -------
+    bytes
+        Content of ``tests/data/notebook_for_testing.ipynb``.
+    """
+    return (Path("tests/data") / "notebook_for_testing.ipynb").read_bytes()
+
+
+@pytest.fixture
+def tmp_path_notebook_for_testing(  # pylint: disable=W0621
+    tmp_path: Path, notebook_for_testing_bytes: bytes
+) -> Path:
+    """
+    Write copy of test notebook into a temporary directory.
+
+    Parameters
+    ----------
+    tmp_path
+        Pytest fixture, gives us a temporary directory.
+    notebook_for_testing_bytes
+        Content of test notebook.
+
+    Returns
+    -------
+    Path
+        Copy of test notebook, which test can freely modify.
+    """
+    notebook = tmp_path / "notebook_for_testing.ipynb"
+    notebook.write_bytes(notebook_for_testing_bytes)
+    return notebook
+
+
+@pytest.fixture
+def tmp_notebook_with_trailing_semicolon(tmp_path: Path) -> Iterator[Path]:
     """
     Make temporary copy of test notebook before it's operated on, then revert it.
 
     Parameters
     ----------
-    tmpdir
+    tmp_path
         Pytest fixture, gives us a temporary directory.
 
     Yields
@@ -152,20 +228,20 @@ def tmp_notebook_with_trailing_semicolon(tmpdir: "LocalPath") -> Iterator[Path]:
         Temporary copy of notebook.
     """
     filename = Path("tests/data") / "notebook_with_trailing_semicolon.ipynb"
-    temp_file = Path(tmpdir) / "tmp.ipynb"
+    temp_file = tmp_path / "tmp.ipynb"
     shutil.copy(str(filename), str(temp_file))
     yield filename
     shutil.copy(str(temp_file), str(filename))
 
 
 @pytest.fixture
-def tmp_notebook_with_indented_magics(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_notebook_with_indented_magics(tmp_path: Path) -> Iterator[Path]:
     """
     Make temporary copy of test notebook before it's operated on, then revert it.
 
     Parameters
     ----------
-    tmpdir
+    tmp_path
         Pytest fixture, gives us a temporary directory.
 
     Yields
@@ -174,32 +250,61 @@ def tmp_notebook_with_indented_magics(tmpdir: "LocalPath") -> Iterator[Path]:
         Temporary copy of notebook.
     """
     filename = Path("tests/data") / "notebook_with_indented_magics.ipynb"
-    temp_file = Path(tmpdir) / "tmp.ipynb"
+    temp_file = tmp_path / "tmp.ipynb"
     shutil.copy(str(filename), str(temp_file))
     yield filename
     shutil.copy(str(temp_file), str(filename))
 
 
 @pytest.fixture
-def tmp_notebook_for_autoflake(tmpdir: "LocalPath") -> Iterator[Path]:
+def tmp_notebook_for_autoflake(tmp_path: Path) -> Path:
     """
-    Make temporary copy of test notebook before it's operated on, then revert it.
+    Copy autoflake test notebook into a temporary directory.
+
+    The directory doubles as the notebook's project root, so tests can put
+    a ``pyproject.toml`` next to it without touching the repository.
 
     Parameters
     ----------
-    tmpdir
+    tmp_path
         Pytest fixture, gives us a temporary directory.
 
-    Yields
-    ------
+    Returns
+    -------
     Path
-        Temporary copy of notebook.
+        Copy of notebook, which test can freely modify.
     """
-    filename = Path("tests/data") / "notebook_for_autoflake.ipynb"
-    temp_file = Path(tmpdir) / "tmp.ipynb"
-    shutil.copy(str(filename), str(temp_file))
-    yield filename
-    shutil.copy(str(temp_file), str(filename))
+    notebook = tmp_path / "notebook_for_autoflake.ipynb"
+    shutil.copy(Path("tests/data") / notebook.name, notebook)
+    return notebook
+
+
+@pytest.fixture(scope="session")
+def invalid_notebook(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Write notebook which can't be parsed, once per session.
+
+    Parameters
+    ----------
+    tmp_path_factory
+        Pytest fixture, gives us a session-scoped temporary directory.
+
+    Returns
+    -------
+    Path
+        Path of a notebook with invalid JSON content.
+    """
+    path = tmp_path_factory.mktemp("invalid_data") / "invalid_notebook.ipynb"
+    path.write_text("foo", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def tmp_flake8_config() -> Iterator[Path]:
+    """Let test write ``.flake8`` in root dir, removing it afterwards even if it fails."""
+    config_file = Path(".flake8")
+    yield config_file
+    config_file.unlink(missing_ok=True)
 
 
 @pytest.fixture
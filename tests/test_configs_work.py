@@ -10,16 +10,18 @@ if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
 
 
-def test_configs_work(capsys: "CaptureFixture") -> None:
+def test_configs_work(tmp_flake8_config: Path, capsys: "CaptureFixture") -> None:
     """
     Check a flake8 cfg file is picked up by nbqa.
 
     Parameters
     ----------
+    tmp_flake8_config
+        Path of flake8 config file in root dir, removed after the test.
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    Path(".flake8").write_text(
+    tmp_flake8_config.write_text(
         dedent(
             """\
             [flake8]
@@ -33,8 +35,6 @@ def test_configs_work(capsys: "CaptureFixture") -> None:
 
     main(["flake8", "tests", "--ignore", "E302"])
 
-    Path(".flake8").unlink()
-
     # check out and err
     out, _ = capsys.readouterr()
     expected_out = ""
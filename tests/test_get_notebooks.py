@@ -2,31 +2,27 @@
 
 import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 import pytest
 
 from nbqa.__main__ import _get_notebooks
 
-if TYPE_CHECKING:
-    from py._path.local import LocalPath
-
 CLEAN_NOTEBOOK = Path("tests") / "data/clean_notebook.ipynb"
 
 
 @pytest.mark.parametrize("dir_", [".git", "venv", "_build"])
-def test_get_notebooks(tmpdir: "LocalPath", dir_: str) -> None:
+def test_get_notebooks(tmp_path: Path, dir_: str) -> None:
     """
     Check that unwanted directories are excluded.
 
     Parameters
     ----------
-    tmpdir
+    tmp_path
         Pytest fixture, gives us a temporary directory.
     dir_
         Directory where we expected notebooks to be ignored.
     """
-    Path(tmpdir / f"{dir_}/tests/data").mkdir(parents=True)
-    shutil.copy(str(CLEAN_NOTEBOOK), str(tmpdir / dir_ / CLEAN_NOTEBOOK))
-    result = list(_get_notebooks(tmpdir))
+    (tmp_path / dir_ / "tests/data").mkdir(parents=True)
+    shutil.copy(CLEAN_NOTEBOOK, tmp_path / dir_ / CLEAN_NOTEBOOK)
+    result = list(_get_notebooks(str(tmp_path)))
     assert not result
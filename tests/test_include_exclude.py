@@ -10,6 +10,8 @@ from nbqa.__main__ import main
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
 
+NOTEBOOK_FOR_PATTERN = re.compile(r"tests.data.notebook_for")
+
 
 def test_cli_files(capsys: "CaptureFixture") -> None:
     """
@@ -23,9 +25,7 @@ def test_cli_files(capsys: "CaptureFixture") -> None:
     main(["flake8", "tests", "--nbqa-files", "^tests/data/notebook_for"])
 
     out, _ = capsys.readouterr()
-    assert out and all(
-        re.search(r"tests.data.notebook_for", i) for i in out.splitlines()
-    )
+    assert out and all(NOTEBOOK_FOR_PATTERN.search(i) for i in out.splitlines())
 
 
 def test_cli_exclude(capsys: "CaptureFixture") -> None:
@@ -40,9 +40,7 @@ def test_cli_exclude(capsys: "CaptureFixture") -> None:
     main(["flake8", "tests", "--nbqa-exclude", "^tests/data/notebook_for"])
 
     out, _ = capsys.readouterr()
-    assert out and all(
-        re.search(r"tests.data.notebook_for", i) is None for i in out.splitlines()
-    )
+    assert out and all(NOTEBOOK_FOR_PATTERN.search(i) is None for i in out.splitlines())
 
 
 def test_config_files(capsys: "CaptureFixture") -> None:
@@ -67,9 +65,7 @@ def test_config_files(capsys: "CaptureFixture") -> None:
     Path("pyproject.toml").unlink()
 
     out, _ = capsys.readouterr()
-    assert out and all(
-        re.search(r"tests.data.notebook_for", i) for i in out.splitlines()
-    )
+    assert out and all(NOTEBOOK_FOR_PATTERN.search(i) for i in out.splitlines())
 
 
 def test_config_exclude(capsys: "CaptureFixture") -> None:
@@ -95,6 +91,4 @@ def test_config_exclude(capsys: "CaptureFixture") -> None:
     Path("pyproject.toml").unlink()
 
     out, _ = capsys.readouterr()
-    assert out and all(
-        re.search(r"tests.data.notebook_for", i) is None for i in out.splitlines()
-    )
+    assert out and all(NOTEBOOK_FOR_PATTERN.search(i) is None for i in out.splitlines())
@@ -12,7 +12,6 @@ from nbqa.__main__ import main
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
-    from py._path.local import LocalPath
 
 
 def _create_ignore_cell_config(config_file_path: Path, config: str) -> None:
@@ -44,7 +43,7 @@ def _validate_magics_with_black(before: Sequence[str], after: Sequence[str]) ->
         True if validation succeeded else False
     """
     diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = "".join(i for i in diff if i.startswith(("+ ", "- ")))
     expected = (
         '-    "def compute(operand1,operand2, bin_op):\\n",\n'
         '+    "def compute(operand1, operand2, bin_op):\\n",\n'
@@ -61,7 +60,7 @@ def _validate_magics_with_black(before: Sequence[str], after: Sequence[str]) ->
 
 
 def test_indented_magics(
-    tmp_notebook_with_indented_magics: "LocalPath",
+    tmp_notebook_with_indented_magics: Path,
 ) -> None:
     """Check if the indented line magics are retained properly after mutating."""
     with open(str(tmp_notebook_with_indented_magics), encoding="utf-8") as handle:
@@ -98,12 +97,12 @@ def _validate_magics_flake8_warnings(actual: str, test_nb_path: Path) -> bool:
 def test_magics_with_flake8(
     config: str,
     validate: Callable[..., bool],
-    tmpdir: "LocalPath",
+    tmp_path: Path,
     capsys: "CaptureFixture",
 ) -> None:
     """Test nbqa with flake8 on notebook with different types of ipython magics."""
     test_nb_path = _copy_notebook(
-        Path("tests/data/notebook_with_indented_magics.ipynb"), Path(tmpdir)
+        Path("tests/data/notebook_with_indented_magics.ipynb"), tmp_path
     )
 
     main(["flake8", str(test_nb_path), config])
@@ -1,13 +1,12 @@
 """Test files saved via jupytext."""
 
 import os
-import warnings
+import re
+import sys
+from importlib import metadata
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-with warnings.catch_warnings():
-    warnings.filterwarnings("ignore", category=DeprecationWarning)
-    import jupytext
+from subprocess import run as subprocess_run
+from typing import TYPE_CHECKING, Any, List, Sequence
 
 import pytest
 
@@ -15,116 +14,191 @@ from nbqa.__main__ import main
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
-    from py._path.local import LocalPath
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+TEST_DATA_DIR = os.path.join("tests", "data")
+INVALID_DATA_DIR = os.path.join("tests", "invalid_data")
+# Read from package metadata so that collecting this module doesn't import jupytext.
+JUPYTEXT_VERSION = metadata.version("jupytext")
+JUPYTEXT_CONFIG_DEPRECATION = re.compile(
+    r"Passing unrecognized arguments to super\(JupytextConfiguration\)"
+)
+
+EXPECTED_MYST = (
+    "---\n"
+    "jupytext:\n"
+    "  text_representation:\n"
+    "    extension: .md\n"
+    "    format_name: myst\n"
+    "    format_version: 0.13\n"
+    f"    jupytext_version: {JUPYTEXT_VERSION}\n"
+    "kernelspec:\n"
+    "  display_name: Python 3\n"
+    "  language: python\n"
+    "  name: python3\n"
+    "substitutions:\n"
+    "  extra_dependencies: bokeh\n"
+    "---\n"
+    "\n"
+    "```{code-cell} ipython3\n"
+    ":tags: [skip-flake8]\n"
+    "\n"
+    "import os\n"
+    "\n"
+    "import glob\n"
+    "\n"
+    "import nbqa\n"
+    "```\n"
+    "\n"
+    "# Some markdown cell containing \\\\n"
+    "\n"
+    "\n"
+    '+++ {"tags": ["skip-mdformat"]}\n'
+    "\n"
+    "# First level heading\n"
+    "\n"
+    "```{code-cell} ipython3\n"
+    ":tags: [flake8-skip]\n"
+    "\n"
+    "%%time foo\n"
+    'def hello(name: str = "world\\n'
+    '"):\n'
+    '    """\n'
+    "    Greet user.\n"
+    "\n"
+    "    Examples\n"
+    "    --------\n"
+    "    >>> hello()\n"
+    "    'hello world\\\\n"
+    "'\n"
+    "\n"
+    '    >>> hello("goodbye")\n'
+    "    'hello goodbye'\n"
+    '    """\n'
+    "\n"
+    '    return "hello {}".format(name)\n'
+    "\n"
+    "\n"
+    "!ls\n"
+    "hello(3)\n"
+    "```\n"
+    "\n"
+    "```python\n"
+    "2 +2\n"
+    "```\n"
+    "\n"
+    "```{code-cell} ipython3\n"
+    "    %%bash\n"
+    "\n"
+    "        pwd\n"
+    "```\n"
+    "\n"
+    "```{code-cell} ipython3\n"
+    "from random import randint\n"
+    "\n"
+    "if __debug__:\n"
+    "    %time randint(5,10)\n"
+    "```\n"
+    "\n"
+    "```{code-cell} ipython3\n"
+    "import pprint\n"
+    "import sys\n"
+    "\n"
+    "if __debug__:\n"
+    "    pretty_print_object = pprint.PrettyPrinter(\n"
+    "        indent=4, width=80, stream=sys.stdout, compact=True, depth=5\n"
+    "    )\n"
+    "\n"
+    'pretty_print_object.isreadable(["Hello", "World"])\n'
+    "```\n"
+)
 
+EXPECTED_MD = (
+    "---\n"
+    "jupyter:\n"
+    "  jupytext:\n"
+    "    text_representation:\n"
+    "      extension: .md\n"
+    "      format_name: markdown\n"
+    "      format_version: '1.3'\n"
+    f"      jupytext_version: {JUPYTEXT_VERSION}\n"
+    "  kernelspec:\n"
+    "    display_name: Python 3\n"
+    "    language: python\n"
+    "    name: python3\n"
+    "---\n"
+    "\n"
+    "```python\n"
+    "import os\n"
+    "\n"
+    "import glob\n"
+    "\n"
+    "import nbqa\n"
+    "```\n"
+    "\n"
+    "# Some markdown cell containing \\n"
+    "\n"
+    "\n"
+    "```python\n"
+    "%%time\n"
+    'def hello(name: str = "world\\n'
+    '"):\n'
+    '    """\n'
+    "    Greet user.\n"
+    "\n"
+    "    Examples\n"
+    "    --------\n"
+    "    >>> hello()\n"
+    "    'hello world\\\\n"
+    "'\n"
+    '    >>> hello("goodbye")\n'
+    "    'hello goodby'\n"
+    '    """\n'
+    "    if True:\n"
+    "        %time # indented magic!\n"
+    '    return f"hello {name}"\n'
+    "\n"
+    "\n"
+    "hello(3)\n"
+    "```\n"
+    "\n"
+    "```python\n"
+    "\n"
+    "```\n"
+)
 
-def test_myst(tmp_test_data: Path) -> None:
+INVALID_JUPYTEXT_CONFIG = (
+    "Type: Jupyter Notebook Extension\n"
+    "Name: Jupytext\n"
+    "Section: notebook\n"
+    "Description: Jupytext Menu\n"
+    "tags:\n"
+    "- version control\n"
+    "- markdown\n"
+    "- script\n"
+    "Link: README.md\n"
+    "Icon: jupytext_menu_zoom.png\n"
+    "Main: index.js\n"
+    "Compatibility: 5.x, 6.x\n"
+)
+
+
+def test_myst(tmp_test_data_with_toml: Path) -> None:
     """
     Test notebook in myst format.
 
     Parameters
     ----------
-    tmp_test_data
-        Temporary copy of test data.
+    tmp_test_data_with_toml
+        Temporary copy of test data, with jupytext config file.
     """
-    notebook = tmp_test_data / "notebook_for_testing.md"
+    notebook = tmp_test_data_with_toml / "notebook_for_testing.md"
 
-    with open(tmp_test_data / ".jupytext.toml", "w", encoding="utf-8") as fd:
-        fd.write('notebook_metadata_filter = "substitutions"\n')
     main(["black", str(notebook)])
-    os.remove(tmp_test_data / ".jupytext.toml")
 
-    with open(notebook, encoding="utf-8") as fd:
-        result = fd.read()
-    expected = (
-        "---\n"
-        "jupytext:\n"
-        "  text_representation:\n"
-        "    extension: .md\n"
-        "    format_name: myst\n"
-        "    format_version: 0.13\n"
-        f"    jupytext_version: {jupytext.__version__}\n"
-        "kernelspec:\n"
-        "  display_name: Python 3\n"
-        "  language: python\n"
-        "  name: python3\n"
-        "substitutions:\n"
-        "  extra_dependencies: bokeh\n"
-        "---\n"
-        "\n"
-        "```{code-cell} ipython3\n"
-        ":tags: [skip-flake8]\n"
-        "\n"
-        "import os\n"
-        "\n"
-        "import glob\n"
-        "\n"
-        "import nbqa\n"
-        "```\n"
-        "\n"
-        "# Some markdown cell containing \\\\n"
-        "\n"
-        "\n"
-        '+++ {"tags": ["skip-mdformat"]}\n'
-        "\n"
-        "# First level heading\n"
-        "\n"
-        "```{code-cell} ipython3\n"
-        ":tags: [flake8-skip]\n"
-        "\n"
-        "%%time foo\n"
-        'def hello(name: str = "world\\n'
-        '"):\n'
-        '    """\n'
-        "    Greet user.\n"
-        "\n"
-        "    Examples\n"
-        "    --------\n"
-        "    >>> hello()\n"
-        "    'hello world\\\\n"
-        "'\n"
-        "\n"
-        '    >>> hello("goodbye")\n'
-        "    'hello goodbye'\n"
-        '    """\n'
-        "\n"
-        '    return "hello {}".format(name)\n'
-        "\n"
-        "\n"
-        "!ls\n"
-        "hello(3)\n"
-        "```\n"
-        "\n"
-        "```python\n"
-        "2 +2\n"
-        "```\n"
-        "\n"
-        "```{code-cell} ipython3\n"
-        "    %%bash\n"
-        "\n"
-        "        pwd\n"
-        "```\n"
-        "\n"
-        "```{code-cell} ipython3\n"
-        "from random import randint\n"
-        "\n"
-        "if __debug__:\n"
-        "    %time randint(5,10)\n"
-        "```\n"
-        "\n"
-        "```{code-cell} ipython3\n"
-        "import pprint\n"
-        "import sys\n"
-        "\n"
-        "if __debug__:\n"
-        "    pretty_print_object = pprint.PrettyPrinter(\n"
-        "        indent=4, width=80, stream=sys.stdout, compact=True, depth=5\n"
-        "    )\n"
-        "\n"
-        'pretty_print_object.isreadable(["Hello", "World"])\n'
-        "```\n"
-    )
-    assert result == expected
+    result = notebook.read_text(encoding="utf-8")
+    assert result == EXPECTED_MYST
 
 
 def test_md(tmp_test_data: Path) -> None:
@@ -140,62 +214,8 @@ def test_md(tmp_test_data: Path) -> None:
 
     main(["black", str(notebook)])
 
-    with open(notebook, encoding="utf-8") as fd:
-        result = fd.read()
-    expected = (
-        "---\n"
-        "jupyter:\n"
-        "  jupytext:\n"
-        "    text_representation:\n"
-        "      extension: .md\n"
-        "      format_name: markdown\n"
-        "      format_version: '1.3'\n"
-        f"      jupytext_version: {jupytext.__version__}\n"
-        "  kernelspec:\n"
-        "    display_name: Python 3\n"
-        "    language: python\n"
-        "    name: python3\n"
-        "---\n"
-        "\n"
-        "```python\n"
-        "import os\n"
-        "\n"
-        "import glob\n"
-        "\n"
-        "import nbqa\n"
-        "```\n"
-        "\n"
-        "# Some markdown cell containing \\n"
-        "\n"
-        "\n"
-        "```python\n"
-        "%%time\n"
-        'def hello(name: str = "world\\n'
-        '"):\n'
-        '    """\n'
-        "    Greet user.\n"
-        "\n"
-        "    Examples\n"
-        "    --------\n"
-        "    >>> hello()\n"
-        "    'hello world\\\\n"
-        "'\n"
-        '    >>> hello("goodbye")\n'
-        "    'hello goodby'\n"
-        '    """\n'
-        "    if True:\n"
-        "        %time # indented magic!\n"
-        '    return f"hello {name}"\n'
-        "\n"
-        "\n"
-        "hello(3)\n"
-        "```\n"
-        "\n"
-        "```python\n"
-        "\n"
-        "```\n"
-    )
-    assert result == expected
+    result = notebook.read_text(encoding="utf-8")
+    assert result == EXPECTED_MD
 
 
 def test_non_jupytext_md() -> None:
@@ -208,19 +228,19 @@ def test_non_jupytext_md() -> None:
 
 def test_non_python_md() -> None:
     """Skip non-Python notebooks."""
-    ret = main(["black", os.path.join("tests", "invalid_data", "octave_notebook.md")])
+    ret = main(["black", os.path.join(INVALID_DATA_DIR, "octave_notebook.md")])
     assert ret == 0
 
 
 def test_jupytext_cant_parse() -> None:
     """Check file jupytext can't parse"""
-    ret = main(["black", os.path.join("tests", "invalid_data", "tracker.md")])
+    ret = main(["black", os.path.join(INVALID_DATA_DIR, "tracker.md")])
     assert ret == 0
 
 
-def test_jupytext_with_nbqa_md(capsys: "CaptureFixture") -> None:
+def test_jupytext_with_nbqa_md(capfd: "CaptureFixture") -> None:
     """Should work the same whether running on .md or .ipynb file"""
-    path = os.path.join("tests", "data", "notebook_for_testing.md")
+    path = os.path.join(TEST_DATA_DIR, "notebook_for_testing.md")
     main(
         [
             "blacken-docs",
@@ -229,7 +249,7 @@ def test_jupytext_with_nbqa_md(capsys: "CaptureFixture") -> None:
             "--nbqa-diff",
         ]
     )
-    out, _ = capsys.readouterr()
+    out, _ = capfd.readouterr()
     expected = (
         "\x1b[1mCell 3\x1b[0m\n"
         "------\n"
@@ -247,54 +267,49 @@ def test_jupytext_with_nbqa_md(capsys: "CaptureFixture") -> None:
     main(
         [
             "blacken-docs",
-            os.path.join("tests", "data", "notebook_for_testing.ipynb"),
+            os.path.join(TEST_DATA_DIR, "notebook_for_testing.ipynb"),
             "--nbqa-md",
             "--nbqa-diff",
         ]
     )
-    out, _ = capsys.readouterr()
+    out, _ = capfd.readouterr()
     assert out.replace("\r\n", "\n") == expected.replace(".md", ".ipynb")
 
 
-def test_invalid_config_file(tmpdir: "LocalPath") -> None:
+def test_invalid_config_file(tmp_path: Path) -> None:
     """If reading config file fails, don't fail whole process."""
-    config_file = (
-        "Type: Jupyter Notebook Extension\n"
-        "Name: Jupytext\n"
-        "Section: notebook\n"
-        "Description: Jupytext Menu\n"
-        "tags:\n"
-        "- version control\n"
-        "- markdown\n"
-        "- script\n"
-        "Link: README.md\n"
-        "Icon: jupytext_menu_zoom.png\n"
-        "Main: index.js\n"
-        "Compatibility: 5.x, 6.x\n"
-    )
-    with open(os.path.join(tmpdir, "jupytext.yml"), "w", encoding="utf-8") as fd:
-        fd.write(config_file)
+    (tmp_path / "jupytext.yml").write_text(INVALID_JUPYTEXT_CONFIG, encoding="utf-8")
+    (tmp_path / "foo.md").write_text("bar\n", encoding="utf-8")
+
+    with pytest.warns(DeprecationWarning, match=JUPYTEXT_CONFIG_DEPRECATION):
+        main(["black", str(tmp_path / "foo.md")])
 
-    with open(os.path.join(tmpdir, "foo.md"), "w", encoding="utf-8") as fd:
-        fd.write("bar\n")
 
-    with pytest.warns(
-        DeprecationWarning,
-        match=r"Passing unrecognized arguments to super\(JupytextConfiguration\)",
-    ):
-        main(["black", os.path.join(tmpdir, "foo.md")])
+def test_jupytext_on_folder(
+    monkeypatch: "MonkeyPatch", capfd: "CaptureFixture"
+) -> None:
+    """Check invalid files aren't checked, and that the tool only runs once."""
+    path = INVALID_DATA_DIR
+    commands: List[Sequence[str]] = []
 
+    def _recording_run(args: Sequence[str], *posargs: Any, **kwargs: Any) -> Any:
+        commands.append(args)
+        return subprocess_run(args, *posargs, **kwargs)
 
-def test_jupytext_on_folder(capsys: "CaptureFixture") -> None:
-    """Check invalid files aren't checked."""
-    path = os.path.join("tests", "invalid_data")
+    monkeypatch.setattr("subprocess.run", _recording_run)
     main(
         [
             "pydocstyle",
             path,
         ]
     )
-    out, _ = capsys.readouterr()
+    out, _ = capfd.readouterr()
+    pydocstyle_commands = [
+        i for i in commands if i[:3] == [sys.executable, "-m", "pydocstyle"]
+    ]
+    assert len(pydocstyle_commands) == 1
+    pydocstyle_command = pydocstyle_commands[0]
+    assert len(pydocstyle_command[3:]) == 3
     expected = (
         f'{os.path.join(path, "invalid_syntax.ipynb")}:cell_1:0 at module level:\n'
         "        D100: Missing docstring in public module\n"
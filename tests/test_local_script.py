@@ -1,7 +1,8 @@
 """Tets running local script."""
 
 import os
-from typing import TYPE_CHECKING
+from contextlib import nullcontext as does_not_raise
+from typing import TYPE_CHECKING, ContextManager
 
 import pytest
 
@@ -9,47 +10,47 @@ from nbqa.__main__ import main
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
-
-
-def test_local_script() -> None:
-    """Test local script is picked up."""
-    cwd = os.getcwd()
-    os.chdir(os.path.join("tests", "invalid_data"))
-    try:
-        main(["foobarqux", "."])
-    finally:
-        os.chdir(cwd)
-
-
-def test_local_module() -> None:
-    """Test local module is picked up."""
-    cwd = os.getcwd()
-    os.chdir(os.path.join("tests", "invalid_data"))
-    try:
-        main(["mymod", "."])
-    finally:
-        os.chdir(cwd)
-
-
-def test_local_submodule() -> None:
-    """Test local submodule is picked up."""
-    cwd = os.getcwd()
-    os.chdir(os.path.join("tests", "invalid_data"))
-    try:
-        main(["mymod.mysubmod", "."])
-    finally:
-        os.chdir(cwd)
-
-
-def test_local_nonfound() -> None:
-    """Test local module is picked up."""
-    cwd = os.getcwd()
-    os.chdir(os.path.join("tests", "invalid_data"))
-    try:
-        with pytest.raises(ModuleNotFoundError):
-            main(["fdsfda", "."])
-    finally:
-        os.chdir(cwd)
+    from _pytest.monkeypatch import MonkeyPatch
+
+INVALID_DATA_DIR = os.path.join("tests", "invalid_data")
+
+
+@pytest.fixture
+def invalid_data_dir(monkeypatch: "MonkeyPatch") -> None:
+    """
+    Run test from within ``tests/invalid_data``, restoring cwd afterwards.
+
+    Parameters
+    ----------
+    monkeypatch
+        Pytest fixture, used to change directory.
+    """
+    monkeypatch.chdir(INVALID_DATA_DIR)
+
+
+@pytest.mark.usefixtures("invalid_data_dir")
+@pytest.mark.parametrize(
+    "command, expectation",
+    [
+        ("foobarqux", does_not_raise()),
+        ("mymod", does_not_raise()),
+        ("mymod.mysubmod", does_not_raise()),
+        ("fdsfda", pytest.raises(ModuleNotFoundError)),
+    ],
+)
+def test_local_command(command: str, expectation: ContextManager[object]) -> None:
+    """
+    Test local script, module, and submodule are picked up.
+
+    Parameters
+    ----------
+    command
+        Local script or module to run.
+    expectation
+        Whether running ``command`` should raise.
+    """
+    with expectation:
+        main([command, "."])
 
 
 def test_with_subcommand(capsys: "CaptureFixture") -> None:
@@ -21,10 +21,10 @@ DIRTY_NOTEBOOK = TEST_DATA_DIR / "notebook_for_testing.ipynb"
 CLEAN_NOTEBOOK = TEST_DATA_DIR / "clean_notebook.ipynb"
 
 
-def test_diff_present(capsys: "CaptureFixture") -> None:
+def test_diff_present(capsysbinary: "CaptureFixture") -> None:
     """Test the results on --nbqa-diff on a dirty notebook."""
     main(["black", str(DIRTY_NOTEBOOK), "--nbqa-diff"])
-    out, err = capsys.readouterr()
+    out, err = capsysbinary.readouterr()
     expected_out = (
         "\x1b[1mCell 2\x1b[0m\n"
         "------\n"
@@ -37,25 +37,25 @@ def test_diff_present(capsys: "CaptureFixture") -> None:
         "\x1b[0m\x1b[32m+hello(3)\n"
         "\x1b[0m\n"
         "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
+    ).encode()
     assert out == expected_out
-    assert "1 file reformatted" in err
+    assert b"1 file reformatted" in err
 
 
-def test_invalid_syntax_with_nbqa_diff(capsys: "CaptureFixture") -> None:
+def test_invalid_syntax_with_nbqa_diff(capsysbinary: "CaptureFixture") -> None:
     """
     Check that using nbqa-diff when there's invalid syntax doesn't have empty output.
 
     Parameters
     ----------
-    capsys
-        Pytest fixture to capture stdout and stderr.
+    capsysbinary
+        Pytest fixture to capture stdout and stderr as bytes.
     """
     path = os.path.join("tests", "invalid_data", "assignment_to_literal.ipynb")
 
     main(["black", os.path.abspath(path), "--nbqa-diff", "--nbqa-dont-skip-bad-cells"])
 
-    out, err = capsys.readouterr()
-    expected_out = "Notebook(s) would be left unchanged\n"
+    out, err = capsysbinary.readouterr()
+    expected_out = b"Notebook(s) would be left unchanged\n"
     assert expected_out == out
-    assert "1 file failed to reformat" in err
+    assert b"1 file failed to reformat" in err
@@ -1,6 +1,7 @@
 """Ensure the --nbqa-shell flag correctly calls the underlying command."""
 
 import os
+import re
 import sys
 from shutil import which
 from subprocess import CompletedProcess
@@ -12,6 +13,11 @@ from _pytest.monkeypatch import MonkeyPatch
 
 from nbqa.__main__ import CommandNotFoundError, main
 
+BLACK_EXECUTABLE = which("black")
+COMMAND_NOT_FOUND_MESSAGE = re.compile(
+    re.escape("\x1b[1mnbqa was unable to find some-fictional-command.\x1b[0m")
+)
+
 
 def _message(args: List[str]) -> str:
     return f"I would have run `{args[:-1]}`"
@@ -23,50 +29,55 @@ def subprocess_run(args: List[str], *_, **__):  # type: ignore
     return CompletedProcess(args, 0, b"", b"")
 
 
-def test_nbqa_shell(monkeypatch: MonkeyPatch, capsys: CaptureFixture) -> None:
+@pytest.fixture
+def mock_subprocess_run(monkeypatch: MonkeyPatch) -> None:
+    """Replace subprocess.run with a mock which reports what it would have run."""
+    monkeypatch.setattr("subprocess.run", subprocess_run)
+
+
+@pytest.mark.usefixtures("mock_subprocess_run")
+def test_nbqa_shell(capsysbinary: CaptureFixture) -> None:
     """Check nbqa shell command call."""
     path = os.path.join("tests", "data", "notebook_for_testing.ipynb")
-    monkeypatch.setattr("subprocess.run", subprocess_run)
 
     args = ["black", "--nbqa-shell", path]
-    expected_run = [which("black"), path]
+    expected_run = [BLACK_EXECUTABLE, path]
     main(args)
-    out, err = capsys.readouterr()
+    out, err = capsysbinary.readouterr()
     received = err.strip().splitlines()[1]
-    expected = _message(args=expected_run)  # type:ignore[arg-type]
+    expected = _message(args=expected_run).encode()  # type:ignore[arg-type]
     assert received == expected
-    assert out == "", f"No stdout expected. Received `{out}`"
+    assert out == b"", f"No stdout expected. Received `{out!r}`"
 
 
-def test_nbqa_not_shell(monkeypatch: MonkeyPatch, capsys: CaptureFixture) -> None:
+@pytest.mark.usefixtures("mock_subprocess_run")
+def test_nbqa_not_shell(capsysbinary: CaptureFixture) -> None:
     """Check nbqa without --nbqa-shell command call."""
     path = os.path.join("tests", "data", "notebook_for_testing.ipynb")
-    monkeypatch.setattr("subprocess.run", subprocess_run)
 
     args = ["black", path]
     expected_run = [sys.executable, "-m", "black", path]
     main(args)
-    out, err = capsys.readouterr()
+    out, err = capsysbinary.readouterr()
     received = err.strip().splitlines()[1]
-    expected = _message(args=expected_run)
+    expected = _message(args=expected_run).encode()
     assert received == expected
-    assert out == "", f"No stdout expected. Received `{out}`"
+    assert out == b"", f"No stdout expected. Received `{out!r}`"
 
 
-def test_nbqa_shell_not_found(monkeypatch: MonkeyPatch) -> None:
+@pytest.mark.usefixtures("mock_subprocess_run")
+def test_nbqa_shell_not_found() -> None:
     """Check --nbqa-shell command call with inexistend command."""
     path = os.path.join("tests", "data", "notebook_for_testing.ipynb")
-    monkeypatch.setattr("subprocess.run", subprocess_run)
 
     args = ["some-fictional-command", "--nbqa-shell", path]
-    msg = "\x1b\\[1mnbqa was unable to find some-fictional-command.\x1b\\[0m"
-    with pytest.raises(CommandNotFoundError, match=msg):
+    with pytest.raises(CommandNotFoundError, match=COMMAND_NOT_FOUND_MESSAGE):
         main(args)
 
 
 @pytest.mark.skipif(sys.platform != "linux", reason="needs grep")
-def test_grep(capsys: CaptureFixture) -> None:
+def test_grep(capsysbinary: CaptureFixture) -> None:
     """Check grep with string works."""
     main(["grep 'import pandas'", ".", "--nbqa-shell"])
-    out, _ = capsys.readouterr()
-    assert out == "tests/data/notebook_for_autoflake.ipynb:import pandas as pd\n"
+    out, _ = capsysbinary.readouterr()
+    assert out == b"tests/data/notebook_for_autoflake.ipynb:import pandas as pd\n"
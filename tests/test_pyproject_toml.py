@@ -1,8 +1,6 @@
 """Check configs from :code:`pyproject.toml` are picked up."""
 
-import os
 from pathlib import Path
-from textwrap import dedent
 from typing import TYPE_CHECKING
 
 from nbqa.__main__ import main
@@ -10,77 +8,68 @@ from nbqa.__main__ import main
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
 
+PYPROJECT_TOML = (
+    '[tool.nbqa.addopts]\nflake8 = ["--ignore=F401,E302", "--select=E303"]\n'
+)
+EXTENDED_PYPROJECT_TOML = '[tool.nbqa.addopts]\nflake8 = ["--ignore=F401"]\n'
+# flake8 output when the CLI arguments take precedence over pyproject.toml
+EXPECTED_EXTENDED_OUT = (
+    "{notebook}:cell_1:1:1: F401 'os' imported but unused\n"
+    "{notebook}:cell_1:3:1: F401 'glob' imported but unused\n"
+    "{notebook}:cell_1:5:1: F401 'nbqa' imported but unused\n"
+    "{notebook}:cell_4:1:1: F401 'random.randint' imported but unused\n"
+)
 
-def test_pyproject_toml_works(capsys: "CaptureFixture") -> None:
+
+def test_pyproject_toml_works(
+    tmp_path_notebook_for_testing: Path, capfd: "CaptureFixture"
+) -> None:
     """
     Check if config is picked up from pyproject.toml works.
 
     Parameters
     ----------
-    capsys
+    tmp_path_notebook_for_testing
+        Copy of test notebook, whose directory serves as project root.
+    capfd
         Pytest fixture to capture stdout and stderr.
     """
-    Path("pyproject.toml").write_text(
-        dedent(
-            """
-            [tool.nbqa.addopts]
-            flake8 = [
-                "--ignore=F401,E302",
-                "--select=E303",
-            ]
-            """
-        ),
-        encoding="utf-8",
+    (tmp_path_notebook_for_testing.parent / "pyproject.toml").write_text(
+        PYPROJECT_TOML, encoding="utf-8"
     )
 
-    main(["flake8", "tests"])
-    Path("pyproject.toml").unlink()
+    main(["flake8", str(tmp_path_notebook_for_testing)])
 
-    out, _ = capsys.readouterr()
-    expected_out = ""
-    assert out == expected_out
+    out, _ = capfd.readouterr()
+    assert out == ""
 
 
-def test_cli_extends_pyprojecttoml(capsys: "CaptureFixture") -> None:
+def test_cli_extends_pyprojecttoml(
+    tmp_path_notebook_for_testing: Path, capfd: "CaptureFixture"
+) -> None:
     """
     Check CLI args overwrite pyproject.toml
 
     Parameters
     ----------
-    capsys
+    tmp_path_notebook_for_testing
+        Copy of test notebook, whose directory serves as project root.
+    capfd
         Pytest fixture to capture stdout and stderr.
     """
-    Path("pyproject.toml").write_text(
-        dedent(
-            """
-            [tool.nbqa.addopts]
-            flake8 = [
-                "--ignore=F401",
-            ]
-            """
-        ),
-        encoding="utf-8",
+    (tmp_path_notebook_for_testing.parent / "pyproject.toml").write_text(
+        EXTENDED_PYPROJECT_TOML, encoding="utf-8"
     )
 
     main(
         [
             "flake8",
-            os.path.join("tests", "data", "notebook_for_testing.ipynb"),
+            str(tmp_path_notebook_for_testing),
             "--ignore=E402,W291",
         ]
     )
-    out, _ = capsys.readouterr()
-    Path("pyproject.toml").unlink()
+    out, _ = capfd.readouterr()
 
     # if arguments are specified on command line, they will take precedence
     # over those specified in the pyproject.toml
-    notebook_path = os.path.join("tests", "data", "notebook_for_testing.ipynb")
-    expected_out = dedent(
-        f"""\
-        {notebook_path}:cell_1:1:1: F401 'os' imported but unused
-        {notebook_path}:cell_1:3:1: F401 'glob' imported but unused
-        {notebook_path}:cell_1:5:1: F401 'nbqa' imported but unused
-        {notebook_path}:cell_4:1:1: F401 'random.randint' imported but unused
-        """
-    )
-    assert out == expected_out
+    assert out == EXPECTED_EXTENDED_OUT.format(notebook=tmp_path_notebook_for_testing)
@@ -1,10 +1,11 @@
 """Check that return code from third-party tool is preserved."""
 
-import subprocess
 from functools import partial
 from pathlib import Path
 from typing import Sequence
 
+from nbqa.__main__ import main
+
 TESTS_DIR = Path("tests")
 TEST_DATA_DIR = TESTS_DIR / "data"
 DIRTY_NOTEBOOK = TEST_DATA_DIR / "notebook_for_testing.ipynb"
@@ -20,8 +21,7 @@ PASSED = 0
 def _run_nbqa_with(command: str, notebooks: Sequence[Path], *args: str) -> int:
     """Run nbqa with the QA tool specified by command parameter."""
     notebook_paths = map(str, notebooks)
-    output = subprocess.run(["nbqa", command, *notebook_paths, *args])
-    return output.returncode
+    return main([command, *notebook_paths, *args])
 
 
 def test_flake8_return_code() -> None:
@@ -1,8 +1,6 @@
 """Check configs are picked up when running in different directory."""
 
-import os
 from pathlib import Path
-from textwrap import dedent
 from typing import TYPE_CHECKING
 
 import pytest
@@ -11,19 +9,28 @@ from nbqa.__main__ import main
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+
+ROOT_DIR = Path.cwd()
+NOTEBOOK_FOR_TESTING = ROOT_DIR / "tests/data/notebook_for_testing.ipynb"
+PYPROJECT_TOML = '[tool.nbqa.addopts]\nflake8 = ["--ignore=F401"]\n'
 
 
 @pytest.mark.parametrize(
     "arg, cwd",
     [
-        (Path("tests"), Path.cwd()),
-        (Path("data"), Path.cwd() / "tests"),
-        (Path("notebook_for_testing.ipynb"), Path.cwd() / "tests/data"),
-        (Path.cwd() / "tests/data/notebook_for_testing.ipynb", Path.cwd().parent),
+        (Path("tests"), ROOT_DIR),
+        (Path("data"), ROOT_DIR / "tests"),
+        (Path(NOTEBOOK_FOR_TESTING.name), NOTEBOOK_FOR_TESTING.parent),
+        (NOTEBOOK_FOR_TESTING, ROOT_DIR.parent),
     ],
 )
 def test_running_in_different_dir_works(
-    arg: Path, cwd: Path, capsys: "CaptureFixture"
+    arg: Path,
+    cwd: Path,
+    tmp_pyprojecttoml: Path,
+    monkeypatch: "MonkeyPatch",
+    capsys: "CaptureFixture",
 ) -> None:
     """
     Check .nbqa.ini config is picked up when running from non-root directory.
@@ -34,24 +41,16 @@ def test_running_in_different_dir_works(
         Directory or notebook to run command on.
     cwd
         Directory from which to run command.
+    tmp_pyprojecttoml
+        Path of pyproject.toml in root dir, restored after the test.
+    monkeypatch
+        Pytest fixture, used to change directory for the duration of the test.
+    capsys
+        Pytest fixture to capture stdout and stderr.
     """
-    config_path = Path("pyproject.toml")
-    config_path.write_text(
-        dedent(
-            """\
-            [tool.nbqa.addopts]
-            flake8 = ["--ignore=F401"] \
-            """
-        ),
-        encoding="utf8",
-    )
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(str(cwd))
-        main(["flake8", str(arg)])
-        out, _ = capsys.readouterr()
-        assert "W291" in out
-        assert "F401" not in out
-    finally:
-        os.chdir(original_cwd)
-        Path("pyproject.toml").unlink()
+    tmp_pyprojecttoml.write_text(PYPROJECT_TOML, encoding="utf8")
+    monkeypatch.chdir(cwd)
+    main(["flake8", str(arg)])
+    out, _ = capsys.readouterr()
+    assert "W291" in out
+    assert "F401" not in out
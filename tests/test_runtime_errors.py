@@ -2,7 +2,6 @@
 
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,38 +14,71 @@ if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
     from _pytest.monkeypatch import MonkeyPatch
 
-
-def test_missing_command() -> None:
-    """Check useful error is raised if :code:`nbqa` is run with an invalid command."""
-    msg = (
-        "\x1b\\[1mCommand `some-fictional-command` not found by nbqa.\x1b\\[0m\n"
-        "\n"
-        "Please make sure you have it installed in the same Python environment as nbqa. See\n"
-        "e.g. https://realpython.com/python\\-virtual\\-environments\\-a\\-primer/ for how to set up\n"
-        "a virtual environment in Python, and run:\n"
-        "\n"
-        "    `python -m pip install some-fictional-command`.\n"
-    )
-    with pytest.raises(ModuleNotFoundError, match=msg):
-        main(["some-fictional-command", "tests", "--some-flag"])
-
-
-def test_missing_root_dir(capsys: "CaptureFixture") -> None:
-    """Check useful error message is raised if :code:`nbqa` is called without root_dir."""
-    prefix = "\x1b[1m"
-    suffix = "\x1b[0m"
-    pattern = re.escape(
-        f"""\
+TESTS_DIR = os.path.join(os.getcwd(), "tests")
+NOTEBOOK_FOR_TESTING = os.path.abspath(
+    os.path.join("tests", "data", "notebook_for_testing.ipynb")
+)
+RECONSTRUCT_ERROR_MSG = (
+    f"\n\x1b[1mnbQA failed to process {NOTEBOOK_FOR_TESTING} with exception "
+)
+T_NOTEBOOK = os.path.abspath(os.path.join("tests", "data", "t.ipynb"))
+TRAILING_SEMICOLON_NOTEBOOK = os.path.abspath(
+    os.path.join("tests", "data", "notebook_with_trailing_semicolon.ipynb")
+)
+EXPECTED_REMOVE_ALL_OUT = (
+    "\x1b[1mCell 1\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {T_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {T_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1 +1 @@\n"
+    "\x1b[0m\x1b[31m-from t import A\n"
+    "\x1b[0m\x1b[32m+\n"
+    "\x1b[0m\n"
+    "To apply these changes, remove the `--nbqa-diff` flag\n"
+)
+EXPECTED_REMOVE_ALL_SEMICOLON_OUT = (
+    "\x1b[1mCell 1\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {TRAILING_SEMICOLON_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {TRAILING_SEMICOLON_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,3 +1 @@\n"
+    "\x1b[0m\x1b[31m-import glob;\n"
+    "\x1b[0m\x1b[31m-import nbqa;\n"
+    "\x1b[0m\n"
+    "\x1b[1mCell 2\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {TRAILING_SEMICOLON_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {TRAILING_SEMICOLON_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,3 +1 @@\n"
+    "\x1b[0m\x1b[31m-def func(a, b):\n"
+    "\x1b[0m\x1b[31m-    pass;\n"
+    "\x1b[0m\x1b[31m- \n"
+    "\x1b[0m\x1b[32m+\n"
+    "\x1b[0m\n"
+    "To apply these changes, remove the `--nbqa-diff` flag\n"
+)
+MISSING_COMMAND_MSG = re.compile(
+    "\x1b\\[1mCommand `some-fictional-command` not found by nbqa.\x1b\\[0m\n"
+    "\n"
+    "Please make sure you have it installed in the same Python environment as nbqa. See\n"
+    "e.g. https://realpython.com/python\\-virtual\\-environments\\-a\\-primer/ for how to set up\n"
+    "a virtual environment in Python, and run:\n"
+    "\n"
+    "    `python -m pip install some-fictional-command`.\n"
+)
+MISSING_ROOT_DIR_MSG = re.compile(
+    re.escape(
+        """\
 usage: nbqa <code quality tool> <notebook or directory> <nbqa options> \
 <code quality tool arguments>
 
-{prefix}Please specify:{suffix}
+\x1b[1mPlease specify:\x1b[0m
 - 1) a code quality tool (e.g. `black`, `pyupgrade`, `flake`, ...)
 - 2) some notebooks (or, if supported by the tool, directories)
 - 3) (optional) flags for nbqa (e.g. `--nbqa-diff`, `--nbqa-shell`)
 - 4) (optional) flags for code quality tool (e.g. `--line-length` for `black`)
 
-{prefix}Examples:{suffix}
+\x1b[1mExamples:\x1b[0m
     nbqa flake8 notebook.ipynb
     nbqa black notebook.ipynb --line-length=96
     nbqa pyupgrade notebook_1.ipynb notebook_2.ipynb
@@ -55,22 +87,31 @@ See https://nbqa.readthedocs.io/en/latest/index.html for more details on \
 how to run `nbqa`.\
 """
     )
+    # the program name depends on how nbqa was invoked
+    + "\n[^\n]*: error: the following arguments are required: root_dirs\n"
+)
+
+
+def test_missing_command() -> None:
+    """Check useful error is raised if :code:`nbqa` is run with an invalid command."""
+    with pytest.raises(ModuleNotFoundError, match=MISSING_COMMAND_MSG):
+        main(["some-fictional-command", "tests", "--some-flag"])
 
-    pattern = pattern + ".*: error: the following arguments are required: root_dirs\n"
 
+def test_missing_root_dir(capsys: "CaptureFixture") -> None:
+    """Check useful error message is raised if :code:`nbqa` is called without root_dir."""
     with pytest.raises(SystemExit):
         main(["flake8", "--ignore=E203"])
     _, err = capsys.readouterr()
-    assert re.fullmatch(pattern, err, re.DOTALL)
+    assert MISSING_ROOT_DIR_MSG.fullmatch(err)
 
 
 @pytest.mark.usefixtures("tmp_remove_comments")
 def test_unable_to_reconstruct_message(capsys: "CaptureFixture") -> None:
     """Check error message shows if we're unable to reconstruct notebook."""
-    path = os.path.abspath(os.path.join("tests", "data", "notebook_for_testing.ipynb"))
-    main(["remove_comments", path])
+    main(["remove_comments", NOTEBOOK_FOR_TESTING])
     _, err = capsys.readouterr()
-    assert f"\n\x1b[1mnbQA failed to process {path} with exception " in err
+    assert RECONSTRUCT_ERROR_MSG in err
     assert (
         "Tool did not preserve code separators and cannot be safely used with nbQA"
         in err
@@ -80,58 +121,24 @@ def test_unable_to_reconstruct_message(capsys: "CaptureFixture") -> None:
 @pytest.mark.usefixtures("tmp_remove_all")
 def test_remove_all_no_trailing_sc(capsys: "CaptureFixture") -> None:
     """Check error message shows if we're unable to reconstruct notebook."""
-    path = os.path.abspath(os.path.join("tests", "data", "t.ipynb"))
-    main(["remove_all", path, "--nbqa-diff"])
+    main(["remove_all", T_NOTEBOOK, "--nbqa-diff"])
     out, err = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1 +1 @@\n"
-        "\x1b[0m\x1b[31m-from t import A\n"
-        "\x1b[0m\x1b[32m+\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert out == expected_out
+    assert out == EXPECTED_REMOVE_ALL_OUT
     assert err == ""
 
 
 @pytest.mark.usefixtures("tmp_remove_all")
 def test_remove_all_trailing_semicolon(capsys: "CaptureFixture") -> None:
     """Check error message shows if we're unable to reconstruct notebook."""
-    path = os.path.abspath(
-        os.path.join("tests", "data", "notebook_with_trailing_semicolon.ipynb")
-    )
-    main(["remove_all", path, "--nbqa-diff"])
+    main(["remove_all", TRAILING_SEMICOLON_NOTEBOOK, "--nbqa-diff"])
     out, err = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1,3 +1 @@\n"
-        "\x1b[0m\x1b[31m-import glob;\n"
-        "\x1b[0m\x1b[31m-import nbqa;\n"
-        "\x1b[0m\n"
-        "\x1b[1mCell 2\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1,3 +1 @@\n"
-        "\x1b[0m\x1b[31m-def func(a, b):\n"
-        "\x1b[0m\x1b[31m-    pass;\n"
-        "\x1b[0m\x1b[31m- \n"
-        "\x1b[0m\x1b[32m+\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert out == expected_out
+    assert out == EXPECTED_REMOVE_ALL_SEMICOLON_OUT
     assert err == ""
 
 
-def test_unable_to_reconstruct_message_pythonpath(monkeypatch: "MonkeyPatch") -> None:
+def test_unable_to_reconstruct_message_pythonpath(
+    monkeypatch: "MonkeyPatch", capsys: "CaptureFixture"
+) -> None:
     """
     Same as ``test_unable_to_reconstruct_message`` but we check ``PYTHONPATH`` updates correctly.
 
@@ -139,42 +146,39 @@ def test_unable_to_reconstruct_message_pythonpath(monkeypatch: "MonkeyPatch") ->
     ----------
     monkeypatch
         Pytest fixture, we use it to override ``PYTHONPATH``.
+    capsys
+        Pytest fixture to capture stdout and stderr.
     """
-    path = os.path.abspath(os.path.join("tests", "data", "notebook_for_testing.ipynb"))
-    monkeypatch.setenv("PYTHONPATH", os.path.join(os.getcwd(), "tests"))
-    # We need to run the command via subprocess, so PYTHONPATH influences python
-    output = subprocess.run(
-        [sys.executable, "-m", "nbqa", "remove_comments", path],
-        stderr=subprocess.PIPE,
-        env=os.environ,
-        text=True,
-    )
-    expected_stderr = f"\n\x1b[1mnbQA failed to process {path} with exception "
-    expected_returncode = 123
-    assert expected_stderr in output.stderr
-    assert output.returncode == expected_returncode
+    # PYTHONPATH is what the tool's subprocess sees, sys.path is what nbqa itself sees
+    monkeypatch.setenv("PYTHONPATH", TESTS_DIR)
+    monkeypatch.syspath_prepend(TESTS_DIR)
+    # nbqa imports the tool to check it's installed: record the module's current
+    # state (delitem alone records nothing if it's absent) so teardown restores it
+    monkeypatch.setitem(sys.modules, "remove_comments", None)
+    monkeypatch.delitem(sys.modules, "remove_comments")
+    result = main(["remove_comments", NOTEBOOK_FOR_TESTING])
+    _, err = capsys.readouterr()
+    assert RECONSTRUCT_ERROR_MSG in err
+    assert result == 123
 
 
 @pytest.mark.skip(reason="too slow - TODO how to re-enable / speedup?")
-def test_unable_to_parse(capsys: "CaptureFixture") -> None:
+def test_unable_to_parse(invalid_notebook: Path, capsys: "CaptureFixture") -> None:
     """Check error message shows if we're unable to parse notebook."""
-    path = Path("tests") / "data/invalid_notebook.ipynb"
-    path.write_text("foo")
-    result = main(["flake8", str(path)])
-    path.unlink()
+    result = main(["flake8", str(invalid_notebook)])
     message = "nbQA failed to process"
     _, err = capsys.readouterr()
     assert message in err
     assert result == 123
 
 
-def test_unable_to_parse_with_valid_notebook(capsys: "CaptureFixture") -> None:
+def test_unable_to_parse_with_valid_notebook(
+    invalid_notebook: Path, capsys: "CaptureFixture"
+) -> None:
     """Check error message shows if we're unable to parse notebook."""
-    path_0 = Path("tests") / "data/invalid_notebook.ipynb"
-    path_0.write_text("foo")
+    path_0 = invalid_notebook
     path_1 = Path("tests") / "data/notebook_for_testing.ipynb"
     main(["flake8", str(path_0), str(path_1), "--select", "E402"])
-    path_0.unlink()
     out, err = capsys.readouterr()
     expected_out = (
         f"{str(path_1)}:cell_4:1:1: E402 module level import not at top of file\n"
@@ -186,13 +190,13 @@ def test_unable_to_parse_with_valid_notebook(capsys: "CaptureFixture") -> None:
     assert expected_err in err
 
 
-def test_unable_to_parse_with_valid_notebook_md(capsys: "CaptureFixture") -> None:
+def test_unable_to_parse_with_valid_notebook_md(
+    invalid_notebook: Path, capsys: "CaptureFixture"
+) -> None:
     """Check error message shows if we're unable to parse notebook."""
-    path_0 = Path("tests") / "data/invalid_notebook.ipynb"
-    path_0.write_text("foo")
+    path_0 = invalid_notebook
     path_1 = Path("tests") / "data/notebook_for_testing.ipynb"
     main(["mdformat", str(path_0), str(path_1), "--nbqa-md", "--nbqa-diff"])
-    path_0.unlink()
     out, err = capsys.readouterr()
     expected_out = (
         "\x1b[1mCell 2\x1b[0m\n"
@@ -228,31 +232,19 @@ def test_unable_to_parse_output(capsys: "CaptureFixture") -> None:
     assert out.replace("\r\n", "\n") == expected_out
 
 
-def test_directory_without_notebooks(capsys: "CaptureFixture") -> None:
-    """
-    Check sensible error message is returned if none of the directories passed have notebooks.
-
-    Parameters
-    ----------
-    capsys
-        Pytest fixture to capture stdout and stderr.
-    """
-    main(["black", "LICENSES"])
-    _, err = capsys.readouterr()
-    expected_err = "No notebooks found in given path(s)\n"
-    assert err == expected_err
-
-
-def test_wrong_extension_file(capsys: "CaptureFixture") -> None:
+@pytest.mark.parametrize("path", ["LICENSES", ".readthedocs.yaml"])
+def test_no_notebooks_found(path: str, capsys: "CaptureFixture") -> None:
     """
-    Check sensible error message is returned if none of the directories passed have notebooks.
+    Check sensible error message is returned if none of the paths passed have notebooks.
 
     Parameters
     ----------
+    path
+        Directory without notebooks, or file with the wrong extension.
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    main(["black", ".readthedocs.yaml"])
+    main(["black", path])
     _, err = capsys.readouterr()
     expected_err = "No notebooks found in given path(s)\n"
     assert err == expected_err
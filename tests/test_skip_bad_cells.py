@@ -1,47 +1,59 @@
 """Test the skip bad cells flag."""
 
 import os
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import pytest
 
 from nbqa.__main__ import main
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
 
+AUTOMAGIC_NOTEBOOK = os.path.join("tests", "invalid_data", "automagic.ipynb")
+EXPECTED_OUT = (
+    "\x1b[1mCell 1\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {AUTOMAGIC_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {AUTOMAGIC_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,2 +1,2 @@\n"
+    "\x1b[0m\x1b[31m-    print('definitely valid')\n"
+    '\x1b[0m\x1b[32m+    print("definitely valid")\n'
+    "\x1b[0m\n"
+    "To apply these changes, remove the `--nbqa-diff` flag\n"
+)
 
-def test_cmdline(capsys: "CaptureFixture") -> None:
-    """Check running from command-line."""
-    file = os.path.join("tests", "invalid_data", "automagic.ipynb")
-    main(["black", file, "--nbqa-diff"])
-    out, _ = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {file}\n"
-        f"\x1b[0m\x1b[1;37m+++ {file}\n"
-        "\x1b[0m\x1b[36m@@ -1,2 +1,2 @@\n"
-        "\x1b[0m\x1b[31m-    print('definitely valid')\n"
-        '\x1b[0m\x1b[32m+    print("definitely valid")\n'
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert out == expected_out
-
-
-def test_config_file(capsys: "CaptureFixture") -> None:
-    """Test setting in config file."""
-    file = os.path.join("tests", "invalid_data", "automagic.ipynb")
-    main(["black", file, "--nbqa-diff"])
+
+@pytest.mark.parametrize(
+    "nbqa_args, pyproject",
+    [
+        (["--nbqa-diff"], None),
+        ([], "[tool.nbqa.diff]\nblack = true\n"),
+    ],
+)
+def test_skip_bad_cells(
+    nbqa_args: Sequence[str],
+    pyproject: Optional[str],
+    tmp_pyprojecttoml: Path,
+    capsys: "CaptureFixture",
+) -> None:
+    """
+    Check bad cells are skipped, whether options come from command-line or config file.
+
+    Parameters
+    ----------
+    nbqa_args
+        Options passed to nbqa on the command line.
+    pyproject
+        Contents of pyproject.toml, if any.
+    tmp_pyprojecttoml
+        Path of pyproject.toml in root dir, restored after the test.
+    capsys
+        Pytest fixture to capture stdout and stderr.
+    """
+    if pyproject is not None:
+        tmp_pyprojecttoml.write_text(pyproject, encoding="utf-8")
+    main(["black", AUTOMAGIC_NOTEBOOK, *nbqa_args])
     out, _ = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {file}\n"
-        f"\x1b[0m\x1b[1;37m+++ {file}\n"
-        "\x1b[0m\x1b[36m@@ -1,2 +1,2 @@\n"
-        "\x1b[0m\x1b[31m-    print('definitely valid')\n"
-        '\x1b[0m\x1b[32m+    print("definitely valid")\n'
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert out == expected_out
+    assert out == EXPECTED_OUT
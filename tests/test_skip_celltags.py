@@ -1,7 +1,10 @@
 """Test the skip_celltags option."""
 
 import os
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import pytest
 
 from nbqa.__main__ import main
 
@@ -9,19 +12,37 @@ if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
 
 
-def test_skip_celltags_cli(capsys: "CaptureFixture") -> None:
+@pytest.mark.parametrize(
+    "nbqa_args, pyproject",
+    [
+        (["--nbqa-skip-celltags=skip-flake8,flake8-skip"], None),
+        ([], "[tool.nbqa.skip_celltags]\nflake8 = ['skip-flake8', 'flake8-skip']\n"),
+    ],
+)
+def test_skip_celltags(
+    nbqa_args: Sequence[str],
+    pyproject: Optional[str],
+    tmp_pyprojecttoml: Path,
+    capsys: "CaptureFixture",
+) -> None:
     """
-    Check flake8 works. Shouldn't alter the notebook content.
+    Check celltags are skipped, whether passed via command-line or config file.
 
     Parameters
     ----------
+    nbqa_args
+        Options passed to nbqa on the command line.
+    pyproject
+        Contents of pyproject.toml, if any.
+    tmp_pyprojecttoml
+        Path of pyproject.toml in root dir, restored after the test.
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    # check passing both absolute and relative paths
-
+    if pyproject is not None:
+        tmp_pyprojecttoml.write_text(pyproject, encoding="utf-8")
     path = os.path.join("tests", "data", "notebook_for_testing.ipynb")
-    main(["flake8", path, "--nbqa-skip-celltags=skip-flake8,flake8-skip"])
+    main(["flake8", path, *nbqa_args])
 
     out, err = capsys.readouterr()
     expected_out = f"{path}:cell_4:1:1: F401 'random.randint' imported but unused\n"
@@ -59,28 +80,3 @@ def test_skip_celltags_cli_md(capsys: "CaptureFixture") -> None:
 
     assert out == expected_out
     assert err == expected_err
-
-
-def test_skip_celltags_pyprojecttoml(capsys: "CaptureFixture") -> None:
-    """
-    Check flake8 works. Shouldn't alter the notebook content.
-
-    Parameters
-    ----------
-    capsys
-        Pytest fixture to capture stdout and stderr.
-    """
-    # check passing both absolute and relative paths
-    with open("pyproject.toml", "w", encoding="utf-8") as handle:
-        handle.write(
-            "[tool.nbqa.skip_celltags]\nflake8 = ['skip-flake8', 'flake8-skip']\n"
-        )
-    path = os.path.join("tests", "data", "notebook_for_testing.ipynb")
-    main(["flake8", path])
-
-    out, err = capsys.readouterr()
-    expected_out = f"{path}:cell_4:1:1: F401 'random.randint' imported but unused\n"
-    expected_err = ""
-
-    assert out == expected_out
-    assert err == expected_err
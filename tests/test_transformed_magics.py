@@ -8,6 +8,19 @@ from nbqa.__main__ import main
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
 
+TRANSFORMED_MAGICS_NOTEBOOK = os.path.join("tests", "data", "transformed_magics.ipynb")
+EXPECTED_OUT = (
+    "\x1b[1mCell 2\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {TRANSFORMED_MAGICS_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {TRANSFORMED_MAGICS_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1 +1 @@\n"
+    "\x1b[0m\x1b[31m-2+2\n"
+    "\x1b[0m\x1b[32m+2 + 2\n"
+    "\x1b[0m\n"
+    "To apply these changes, remove the `--nbqa-diff` flag\n"
+)
+
 
 def test_transformed_magics(capsys: "CaptureFixture") -> None:
     """
@@ -18,18 +31,6 @@ def test_transformed_magics(capsys: "CaptureFixture") -> None:
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    path = os.path.join("tests", "data", "transformed_magics.ipynb")
-    main(["black", path, "--nbqa-diff"])
+    main(["black", TRANSFORMED_MAGICS_NOTEBOOK, "--nbqa-diff"])
     out, _ = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 2\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1 +1 @@\n"
-        "\x1b[0m\x1b[31m-2+2\n"
-        "\x1b[0m\x1b[32m+2 + 2\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert out == expected_out
+    assert out == EXPECTED_OUT
@@ -1,14 +1,30 @@
 """Check configs from :code:`pyproject.toml` are picked up."""
 
-import difflib
+from collections import Counter
 from pathlib import Path
-from textwrap import dedent
-from typing import TYPE_CHECKING, Sequence, Tuple
+from typing import Optional, Sequence, Tuple
+
+import pytest
 
 from nbqa.__main__ import main
 
-if TYPE_CHECKING:
-    from py._path.local import LocalPath
+EXPECTED_REMOVED = Counter(
+    [
+        '    "    unused_var = \\"not used\\"\\n",\n',
+        '    "from os.path import *\\n",\n',
+        '    "import pandas as pd\\n",\n',
+    ]
+)
+EXPECTED_ADDED = Counter(['    "from os.path import abspath\\n",\n'])
+AUTOFLAKE_TOML_CONFIG = (
+    "[tool.nbqa.addopts]\n"
+    "autoflake = [\n"
+    '    "--in-place",\n'
+    '    "--expand-star-imports",\n'
+    '    "--remove-all-unused-imports",\n'
+    '    "--remove-unused-variables"\n'
+    "]\n"
+)
 
 
 def _run_nbqa(
@@ -29,13 +45,11 @@ def _run_nbqa(
     Tuple[Sequence[str], Sequence[str]]
         Content of the notebook before and after running nbQA
     """
-    with open(notebook, encoding="utf-8") as handle:
-        before = handle.readlines()
+    before = Path(notebook).read_text(encoding="utf-8").splitlines(keepends=True)
 
     main([command, notebook, *args])
 
-    with open(notebook, encoding="utf-8") as handle:
-        after = handle.readlines()
+    after = Path(notebook).read_text(encoding="utf-8").splitlines(keepends=True)
 
     return (before, after)
 
@@ -56,62 +70,52 @@ def _validate(before: Sequence[str], after: Sequence[str]) -> bool:
     bool
         True if validation succeeded else False
     """
-    diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
-
-    expected = dedent(
-        """\
-        -    "    unused_var = \\"not used\\"\\n",
-        -    "from os.path import *\\n",
-        +    "from os.path import abspath\\n",
-        -    "import pandas as pd\\n",
-        """
+    before_lines, after_lines = Counter(before), Counter(after)
+    return (
+        after_lines - before_lines == EXPECTED_ADDED
+        and before_lines - after_lines == EXPECTED_REMOVED
     )
-    return result == expected
 
 
-def test_autoflake_cli(tmp_notebook_for_autoflake: "LocalPath") -> None:
-    """Check if autoflake works as expected using the command line configuration."""
-    before, after = _run_nbqa(
-        "autoflake",
-        str(tmp_notebook_for_autoflake),
-        "--in-place",
-        "--expand-star-imports",
-        "--remove-all-unused-imports",
-        "--remove-unused-variables",
-    )
-
-    assert _validate(before, after)
-
-
-def _create_toml_config(config_file: Path) -> None:
+@pytest.mark.parametrize(
+    "autoflake_args, pyproject",
+    [
+        (
+            [
+                "--in-place",
+                "--expand-star-imports",
+                "--remove-all-unused-imports",
+                "--remove-unused-variables",
+            ],
+            None,
+        ),
+        ([], AUTOFLAKE_TOML_CONFIG),
+    ],
+)
+def test_autoflake(
+    autoflake_args: Sequence[str],
+    pyproject: Optional[str],
+    tmp_notebook_for_autoflake: Path,
+) -> None:
     """
-    Create TOML configuration in the test directory.
+    Check autoflake works as expected, configured via command line or pyproject.toml.
 
     Parameters
     ----------
-    config_file : Path
-        nbqa configuration file
+    autoflake_args
+        Options passed to autoflake on the command line.
+    pyproject
+        Contents of pyproject.toml, if any.
+    tmp_notebook_for_autoflake
+        Copy of notebook to run autoflake on, in its own project root.
     """
-    config_file.write_text(
-        dedent(
-            """
-            [tool.nbqa.addopts]
-            autoflake = [
-                "--in-place",
-                "--expand-star-imports",
-                "--remove-all-unused-imports",
-                "--remove-unused-variables"
-            ]
-            """
+    if pyproject is not None:
+        (tmp_notebook_for_autoflake.parent / "pyproject.toml").write_text(
+            pyproject, encoding="utf-8"
         )
-    )
 
-
-def test_autoflake_toml(tmp_notebook_for_autoflake: "LocalPath") -> None:
-    """Check if autoflake works as expected using the configuration from pyproject.toml."""
-    _create_toml_config(Path("pyproject.toml"))
-
-    before, after = _run_nbqa("autoflake", str(tmp_notebook_for_autoflake))
+    before, after = _run_nbqa(
+        "autoflake", str(tmp_notebook_for_autoflake), *autoflake_args
+    )
 
     assert _validate(before, after)
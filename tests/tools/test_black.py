@@ -3,22 +3,125 @@
 import difflib
 import operator
 import os
-import subprocess
 from pathlib import Path
 from shutil import copyfile
 from textwrap import dedent
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, List, Sequence
 
 from nbqa.__main__ import main
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
-    from py._path.local import LocalPath
 
-SPARKLES = "\N{sparkles}"
-SHORTCAKE = "\N{shortcake}"
-COLLISION = "\N{collision symbol}"
-BROKEN_HEART = "\N{broken heart}"
+TO_APPLY_MSG = "To apply these changes, remove the `--nbqa-diff` flag\n"
+COMMENTED_OUT_MAGIC_NOTEBOOK = os.path.abspath(
+    os.path.join("tests", "data", "commented_out_magic.ipynb")
+)
+EXPECTED_COMMENTED_OUT_MAGIC_OUT = (
+    "\x1b[1mCell 1\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {COMMENTED_OUT_MAGIC_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {COMMENTED_OUT_MAGIC_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,2 +1 @@\n"
+    "\x1b[0m\x1b[31m-[1, 2,\n"
+    "\x1b[0m\x1b[31m-3, 4]\n"
+    "\x1b[0m\x1b[32m+[1, 2, 3, 4]\n"
+    "\x1b[0m\n"
+    f"{TO_APPLY_MSG}"
+)
+STARTING_WITH_COMMENT_NOTEBOOK = os.path.abspath(
+    os.path.join("tests", "data", "starting_with_comment.ipynb")
+)
+EXPECTED_STARTING_WITH_COMMENT_OUT = (
+    "\x1b[1mCell 3\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {STARTING_WITH_COMMENT_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {STARTING_WITH_COMMENT_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,3 +1,3 @@\n"
+    '\x1b[0m\x1b[31m-def example_func(hi = "yo"):\n'
+    '\x1b[0m\x1b[32m+def example_func(hi="yo"):\n'
+    "\x1b[0m\n"
+    f"{TO_APPLY_MSG}"
+)
+DEFAULT_MAGIC_NOTEBOOK = os.path.abspath(
+    os.path.join("tests", "data", "default_magic.ipynb")
+)
+NON_DEFAULT_MAGIC_NOTEBOOK = os.path.abspath(
+    os.path.join("tests", "data", "non_default_magic.ipynb")
+)
+# same cell in default_magic.ipynb and non_default_magic.ipynb, once it's processed
+EXPECTED_MAGIC_DIFF = (
+    "\x1b[1mCell 1\x1b[0m\n"
+    "------\n"
+    "\x1b[1;37m--- {notebook}\n"
+    "\x1b[0m\x1b[1;37m+++ {notebook}\n"
+    "\x1b[0m\x1b[36m@@ -1,3 +1,3 @@\n"
+    "\x1b[0m\x1b[31m-a = 2 \n"
+    "\x1b[0m\x1b[32m+a = 2\n"
+    "\x1b[0m\n"
+    f"{TO_APPLY_MSG}"
+)
+COMMENT_AFTER_TRAILING_SEMICOLON_NOTEBOOK = os.path.abspath(
+    os.path.join("tests", "data", "comment_after_trailing_semicolon.ipynb")
+)
+EXPECTED_COMMENT_AFTER_TRAILING_SEMICOLON_OUT = (
+    "\x1b[1mCell 1\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {COMMENT_AFTER_TRAILING_SEMICOLON_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {COMMENT_AFTER_TRAILING_SEMICOLON_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,4 +1,5 @@\n"
+    "\x1b[0m\x1b[31m-import glob;\n"
+    "\x1b[0m\x1b[32m+import glob\n"
+    "\x1b[0m\x1b[32m+\n"
+    "\x1b[0m\n"
+    "\x1b[1mCell 2\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {COMMENT_AFTER_TRAILING_SEMICOLON_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {COMMENT_AFTER_TRAILING_SEMICOLON_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,3 +1,2 @@\n"
+    "\x1b[0m\x1b[31m- \n"
+    "\x1b[0m\n"
+    f"{TO_APPLY_MSG}"
+)
+ENV_VAR_NOTEBOOK = os.path.abspath(os.path.join("tests", "data", "env_var.ipynb"))
+EXPECTED_ENV_VAR_OUT = (
+    "\x1b[1mCell 1\x1b[0m\n"
+    "------\n"
+    f"\x1b[1;37m--- {ENV_VAR_NOTEBOOK}\n"
+    f"\x1b[0m\x1b[1;37m+++ {ENV_VAR_NOTEBOOK}\n"
+    "\x1b[0m\x1b[36m@@ -1,2 +1,2 @@\n"
+    "\x1b[0m\x1b[31m-var  = %env var\n"
+    "\x1b[0m\x1b[32m+var = %env var\n"
+    "\x1b[0m\n"
+    f"{TO_APPLY_MSG}"
+)
+
+
+def _changed_lines(before: Sequence[str], after: Sequence[str]) -> str:
+    """
+    Get lines which differ between ``before`` and ``after``.
+
+    Parameters
+    ----------
+    before
+        Lines of notebook before running tool.
+    after
+        Lines of notebook after running tool.
+
+    Returns
+    -------
+    str
+        Removed lines prefixed with ``-``, added lines prefixed with ``+``, as in a
+        unified diff.
+    """
+    matcher = difflib.SequenceMatcher(a=before, b=after, autojunk=False)
+    changed: List[str] = []
+    for tag, i_1, i_2, j_1, j_2 in matcher.get_opcodes():
+        if tag in ("replace", "delete"):
+            changed.extend(f"-{line}" for line in before[i_1:i_2])
+        if tag in ("replace", "insert"):
+            changed.extend(f"+{line}" for line in after[j_1:j_2])
+    return "".join(changed)
 
 
 def test_black_works(tmp_notebook_for_testing: Path, capsys: "CaptureFixture") -> None:
@@ -33,16 +136,17 @@ def test_black_works(tmp_notebook_for_testing: Path, capsys: "CaptureFixture") -
         Pytest fixture to capture stdout and stderr.
     """
     # check diff
-    with open(tmp_notebook_for_testing, encoding="utf-8") as handle:
-        before = handle.readlines()
     path = os.path.join("tests", "data", "notebook_for_testing.ipynb")
+    before = tmp_notebook_for_testing.read_text(encoding="utf-8").splitlines(
+        keepends=True
+    )
 
     main(["black", os.path.abspath(path)])
-    with open(tmp_notebook_for_testing, encoding="utf-8") as handle:
-        after = handle.readlines()
+    after = tmp_notebook_for_testing.read_text(encoding="utf-8").splitlines(
+        keepends=True
+    )
 
-    diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = _changed_lines(before, after)
     expected = (
         "-    \"    return 'hello {}'.format(name)\\n\",\n"
         '+    "    return \\"hello {}\\".format(name)\\n",\n'
@@ -72,16 +176,17 @@ def test_black_works_with_trailing_semicolons(
         Pytest fixture to capture stdout and stderr.
     """
     # check diff
-    with open(tmp_notebook_with_trailing_semicolon, encoding="utf-8") as handle:
-        before = handle.readlines()
     path = os.path.join("tests", "data", "notebook_with_trailing_semicolon.ipynb")
+    before = tmp_notebook_with_trailing_semicolon.read_text(
+        encoding="utf-8"
+    ).splitlines(keepends=True)
 
     main(["black", os.path.abspath(path), "--line-length=10"])
-    with open(tmp_notebook_with_trailing_semicolon, encoding="utf-8") as handle:
-        after = handle.readlines()
+    after = tmp_notebook_with_trailing_semicolon.read_text(encoding="utf-8").splitlines(
+        keepends=True
+    )
 
-    diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = _changed_lines(before, after)
     expected = dedent(
         """\
         -    "import glob;\\n",
@@ -119,16 +224,17 @@ def test_black_works_with_multiline(
         Pytest fixture to capture stdout and stderr.
     """
     # check diff
-    with open(tmp_notebook_with_multiline, encoding="utf-8") as handle:
-        before = handle.readlines()
     path = os.path.join("tests", "data", "clean_notebook_with_multiline.ipynb")
+    before = tmp_notebook_with_multiline.read_text(encoding="utf-8").splitlines(
+        keepends=True
+    )
 
     main(["black", os.path.abspath(path)])
-    with open(tmp_notebook_with_multiline, encoding="utf-8") as handle:
-        after = handle.readlines()
+    after = tmp_notebook_with_multiline.read_text(encoding="utf-8").splitlines(
+        keepends=True
+    )
 
-    diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = _changed_lines(before, after)
     expected = dedent(
         """\
         -    "assert 1 + 1 == 2;  assert 1 + 1 == 2;"
@@ -155,26 +261,28 @@ def test_black_multiple_files(tmp_test_data: Path) -> None:
         Temporary copy of test data.
     """
     # check diff
-    with open(
-        str(tmp_test_data / "notebook_for_testing.ipynb"), encoding="utf-8"
-    ) as handle:
-        before = handle.readlines()
+    before = (
+        (tmp_test_data / "notebook_for_testing.ipynb")
+        .read_text(encoding="utf-8")
+        .splitlines(keepends=True)
+    )
     path = os.path.abspath(os.path.join("tests", "data"))
 
     main(["black", path])
-    with open(
-        str(tmp_test_data / "notebook_for_testing.ipynb"), encoding="utf-8"
-    ) as handle:
-        after = handle.readlines()
+    after = (
+        (tmp_test_data / "notebook_for_testing.ipynb")
+        .read_text(encoding="utf-8")
+        .splitlines(keepends=True)
+    )
 
     diff = difflib.unified_diff(before, after)
     assert "".join(diff) != ""
 
 
-def test_successive_runs_using_black(tmpdir: "LocalPath") -> None:
+def test_successive_runs_using_black(tmp_path: Path) -> None:
     """Check black returns 0 on the second run given a dirty notebook."""
     src_notebook = Path(os.path.join("tests", "data", "notebook_for_testing.ipynb"))
-    test_notebook = Path(tmpdir) / src_notebook.name
+    test_notebook = tmp_path / src_notebook.name
     copyfile(src_notebook, test_notebook)
 
     def run_black(
@@ -182,11 +290,9 @@ def test_successive_runs_using_black(tmpdir: "LocalPath") -> None:
     ) -> bool:
         """Run black using nbqa and validate the output."""
         mod_time_before: float = os.path.getmtime(test_notebook)
-        output = subprocess.run(["nbqa", "black", test_notebook])
+        output = main(["black", test_notebook])
         mod_time_after: float = os.path.getmtime(test_notebook)
-        return output.returncode == 0 and mod_time_compare_op(
-            mod_time_after, mod_time_before
-        )
+        return output == 0 and mod_time_compare_op(mod_time_after, mod_time_before)
 
     assert run_black(str(test_notebook), operator.gt)
     assert run_black(str(test_notebook), operator.eq)
@@ -201,24 +307,10 @@ def test_black_works_with_commented_magics(capsys: "CaptureFixture") -> None:
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    path = os.path.join("tests", "data", "commented_out_magic.ipynb")
-
-    main(["black", os.path.abspath(path), "--nbqa-diff"])
+    main(["black", COMMENTED_OUT_MAGIC_NOTEBOOK, "--nbqa-diff"])
 
     out, err = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {os.path.abspath(path)}\n"
-        f"\x1b[0m\x1b[1;37m+++ {os.path.abspath(path)}\n"
-        "\x1b[0m\x1b[36m@@ -1,2 +1 @@\n"
-        "\x1b[0m\x1b[31m-[1, 2,\n"
-        "\x1b[0m\x1b[31m-3, 4]\n"
-        "\x1b[0m\x1b[32m+[1, 2, 3, 4]\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert expected_out.replace("\r\n", "\n") == out
+    assert out.replace("\r\n", "\n") == EXPECTED_COMMENTED_OUT_MAGIC_OUT
     assert "1 file reformatted" in err
 
 
@@ -231,23 +323,10 @@ def test_black_works_with_leading_comment(capsys: "CaptureFixture") -> None:
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    path = os.path.join("tests", "data", "starting_with_comment.ipynb")
-
-    main(["black", os.path.abspath(path), "--nbqa-diff"])
+    main(["black", STARTING_WITH_COMMENT_NOTEBOOK, "--nbqa-diff"])
 
     out, err = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 3\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {os.path.abspath(path)}\n"
-        f"\x1b[0m\x1b[1;37m+++ {os.path.abspath(path)}\n"
-        "\x1b[0m\x1b[36m@@ -1,3 +1,3 @@\n"
-        '\x1b[0m\x1b[31m-def example_func(hi = "yo"):\n'
-        '\x1b[0m\x1b[32m+def example_func(hi="yo"):\n'
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert expected_out.replace("\r\n", "\n") == out
+    assert out.replace("\r\n", "\n") == EXPECTED_STARTING_WITH_COMMENT_OUT
     assert "1 file reformatted" in err
 
 
@@ -275,9 +354,7 @@ def test_not_allowlisted_magic(capsys: "CaptureFixture") -> None:
     """
     Notebook contains magic which isn't in the default allowlist.
     """
-    path = os.path.abspath(os.path.join("tests", "data", "non_default_magic.ipynb"))
-
-    main(["black", path])
+    main(["black", NON_DEFAULT_MAGIC_NOTEBOOK])
 
     _, err = capsys.readouterr()
     assert "1 file left unchanged" in err
@@ -287,20 +364,9 @@ def test_allowlisted_magic(capsys: "CaptureFixture") -> None:
     """
     Notebook contains magic which is in the default allowlist.
     """
-    path = os.path.abspath(os.path.join("tests", "data", "default_magic.ipynb"))
-    main(["black", path, "--nbqa-diff"])
+    main(["black", DEFAULT_MAGIC_NOTEBOOK, "--nbqa-diff"])
     out, _ = capsys.readouterr()
-    expected = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1,3 +1,3 @@\n"
-        "\x1b[0m\x1b[31m-a = 2 \n"
-        "\x1b[0m\x1b[32m+a = 2\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
+    expected = EXPECTED_MAGIC_DIFF.format(notebook=DEFAULT_MAGIC_NOTEBOOK)
     assert out.replace("\r\n", "\n") == expected
 
 
@@ -308,45 +374,36 @@ def test_process_cells_magic(capsys: "CaptureFixture") -> None:
     """
     Notebook contains non-allowlist magic, but it's in process_cells.
     """
-    path = os.path.abspath(os.path.join("tests", "data", "non_default_magic.ipynb"))
-    main(["black", path, "--nbqa-diff", "--nbqa-process-cells", "javascript,foo"])
+    main(
+        [
+            "black",
+            NON_DEFAULT_MAGIC_NOTEBOOK,
+            "--nbqa-diff",
+            "--nbqa-process-cells",
+            "javascript,foo",
+        ]
+    )
 
     out, _ = capsys.readouterr()
-    expected = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1,3 +1,3 @@\n"
-        "\x1b[0m\x1b[31m-a = 2 \n"
-        "\x1b[0m\x1b[32m+a = 2\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
+    expected = EXPECTED_MAGIC_DIFF.format(notebook=NON_DEFAULT_MAGIC_NOTEBOOK)
     assert out.replace("\r\n", "\n") == expected
 
 
-def test_process_cells_magic_pyprojecttoml(capsys: "CaptureFixture") -> None:
+def test_process_cells_magic_pyprojecttoml(
+    tmp_path: Path, capsys: "CaptureFixture"
+) -> None:
     """
     Notebook contains non-allowlist magic, but it's in process_cells.
     """
-    with open("pyproject.toml", "w", encoding="utf-8") as handle:
-        handle.write("[tool.nbqa.process_cells]\nblack = ['javascript', 'foo']\n")
-    path = os.path.abspath(os.path.join("tests", "data", "non_default_magic.ipynb"))
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.nbqa.process_cells]\nblack = ['javascript', 'foo']\n", encoding="utf-8"
+    )
+    path = str(tmp_path / "non_default_magic.ipynb")
+    copyfile(NON_DEFAULT_MAGIC_NOTEBOOK, path)
     main(["black", path, "--nbqa-diff"])
 
     out, _ = capsys.readouterr()
-    expected = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1,3 +1,3 @@\n"
-        "\x1b[0m\x1b[31m-a = 2 \n"
-        "\x1b[0m\x1b[32m+a = 2\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
+    expected = EXPECTED_MAGIC_DIFF.format(notebook=path)
     assert out.replace("\r\n", "\n") == expected
 
 
@@ -421,31 +478,10 @@ def test_comment_after_trailing_comma(capsys: "CaptureFixture") -> None:
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    path = os.path.join("tests", "data", "comment_after_trailing_semicolon.ipynb")
-
-    main(["black", os.path.abspath(path), "--nbqa-diff"])
+    main(["black", COMMENT_AFTER_TRAILING_SEMICOLON_NOTEBOOK, "--nbqa-diff"])
 
     out, _ = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {os.path.abspath(path)}\n"
-        f"\x1b[0m\x1b[1;37m+++ {os.path.abspath(path)}\n"
-        "\x1b[0m\x1b[36m@@ -1,4 +1,5 @@\n"
-        "\x1b[0m\x1b[31m-import glob;\n"
-        "\x1b[0m\x1b[32m+import glob\n"
-        "\x1b[0m\x1b[32m+\n"
-        "\x1b[0m\n"
-        "\x1b[1mCell 2\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {os.path.abspath(path)}\n"
-        f"\x1b[0m\x1b[1;37m+++ {os.path.abspath(path)}\n"
-        "\x1b[0m\x1b[36m@@ -1,3 +1,2 @@\n"
-        "\x1b[0m\x1b[31m- \n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert out == expected_out
+    assert out == EXPECTED_COMMENT_AFTER_TRAILING_SEMICOLON_OUT
 
 
 def test_assignment_to_env_var(capsys: "CaptureFixture") -> None:
@@ -457,20 +493,7 @@ def test_assignment_to_env_var(capsys: "CaptureFixture") -> None:
     capsys
         Pytest fixture to capture stdout and stderr.
     """
-    path = os.path.abspath(os.path.join("tests", "data", "env_var.ipynb"))
-
-    main(["black", path, "--nbqa-diff"])
+    main(["black", ENV_VAR_NOTEBOOK, "--nbqa-diff"])
 
     out, _ = capsys.readouterr()
-    expected_out = (
-        "\x1b[1mCell 1\x1b[0m\n"
-        "------\n"
-        f"\x1b[1;37m--- {path}\n"
-        f"\x1b[0m\x1b[1;37m+++ {path}\n"
-        "\x1b[0m\x1b[36m@@ -1,2 +1,2 @@\n"
-        "\x1b[0m\x1b[31m-var  = %env var\n"
-        "\x1b[0m\x1b[32m+var = %env var\n"
-        "\x1b[0m\n"
-        "To apply these changes, remove the `--nbqa-diff` flag\n"
-    )
-    assert out == expected_out
+    assert out == EXPECTED_ENV_VAR_OUT
@@ -95,7 +95,7 @@ def test_cell_with_all_magics(capsys: "CaptureFixture") -> None:
 
 
 def test_per_file_ignores(
-    tmp_notebook_for_testing: Path, capsys: "CaptureFixture"
+    tmp_notebook_for_testing: Path, tmp_flake8_config: Path, capsys: "CaptureFixture"
 ) -> None:
     """
     Check flake8 per-file-ignore patterns work.
@@ -104,12 +104,13 @@ def test_per_file_ignores(
     ----------
     tmp_notebook_for_testing
         notebook Path to test
+    tmp_flake8_config
+        Path of flake8 config file in root dir, removed after the test.
     capsys
         Pytest fixture to capture stdout and stderr.
     """
     # enable per-file ignores with nbqa glob
-    flake8_ini = Path(".flake8")
-    flake8_ini.write_text(
+    tmp_flake8_config.write_text(
         dedent(
             """
         [flake8]
@@ -122,7 +123,6 @@ def test_per_file_ignores(
     )
 
     main(["flake8", str(tmp_notebook_for_testing)])
-    flake8_ini.unlink()
 
     expected_path_0 = os.path.join("tests", "data", "notebook_for_testing.ipynb")
 
@@ -36,7 +36,7 @@ def test_isort_works(tmp_notebook_for_testing: Path, capsys: "CaptureFixture") -
     with open(tmp_notebook_for_testing, encoding="utf-8") as handle:
         after = handle.readlines()
     diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = "".join(i for i in diff if i.startswith(("+ ", "- ")))
 
     expected = dedent(
         """\
@@ -77,7 +77,7 @@ def test_isort_initial_md(
     with open(tmp_notebook_starting_with_md, encoding="utf-8") as handle:
         after = handle.readlines()
     diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = "".join(i for i in diff if i.startswith(("+ ", "- ")))
 
     expected = dedent(
         """\
@@ -158,7 +158,7 @@ def test_isort_trailing_semicolon(tmp_notebook_with_trailing_semicolon: Path) ->
     with open(tmp_notebook_with_trailing_semicolon, encoding="utf-8") as handle:
         after = handle.readlines()
     diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = "".join(i for i in diff if i.startswith(("+ ", "- ")))
 
     expected = '-    "import glob;\\n",\n+    "import glob\\n",\n'
     assert result == expected
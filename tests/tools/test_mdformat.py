@@ -22,7 +22,7 @@ def test_mdformat(tmp_notebook_for_testing: Path) -> None:
         after = handle.readlines()
 
     diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = "".join(i for i in diff if i.startswith(("+ ", "- ")))
     expected = (
         '-    "First level heading\\n",\n-    "==="\n+    "# First level heading"\n'
     )
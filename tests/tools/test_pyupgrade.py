@@ -43,7 +43,7 @@ def test_pyupgrade(tmp_notebook_for_testing: Path, capsys: "CaptureFixture") ->
         after = handle.readlines()
 
     diff = difflib.unified_diff(before, after)
-    result = "".join(i for i in diff if any([i.startswith("+ "), i.startswith("- ")]))
+    result = "".join(i for i in diff if i.startswith(("+ ", "- ")))
     expected = dedent(
         """\
         -    \"    return 'hello {}'.format(name)\\n\",